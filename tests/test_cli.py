@@ -0,0 +1,53 @@
+import argparse
+import contextlib
+import io
+import sys
+import types
+import unittest
+from unittest import mock
+
+from wikipedia_tool import cli
+
+
+def _echo(**kwargs):
+    return repr(kwargs)
+
+
+class RunFunctionTest(unittest.TestCase):
+    def run_cli(self, *params):
+        module = types.ModuleType("wikipedia_tool")
+        module.echo = _echo
+        args = argparse.Namespace(function="echo", params=list(params))
+        out = io.StringIO()
+        with mock.patch.dict(sys.modules, {"wikipedia_tool": module}), contextlib.redirect_stdout(out):
+            cli.run_function(args)
+        return out.getvalue().strip()
+
+    def test_params_are_decoded_like_json_loads(self):
+        self.assertEqual(
+            self.run_cli("n=123456789012345678901234567890", "x=NaN", "s=plain", "l=[1, 2]"),
+            repr({"n": 123456789012345678901234567890, "x": float("nan"), "s": "plain", "l": [1, 2]}),
+        )
+
+
+class MainUsageTest(unittest.TestCase):
+    def run_main(self, *argv):
+        err = io.StringIO()
+        with mock.patch.object(sys, "argv", ["cli.py", *argv]), contextlib.redirect_stderr(err):
+            with self.assertRaises(SystemExit):
+                cli.main()
+        return err.getvalue()
+
+    def test_usage_lists_all_subcommands(self):
+        self.assertIn("usage: cli.py [-h] {list,help,run} ...", self.run_main("list", "--bogus"))
+
+    def test_error_messages_name_subcommand(self):
+        self.assertIn("the following arguments are required: subcommand", self.run_main())
+        self.assertIn("argument subcommand: invalid choice: 'bogus'", self.run_main("bogus"))
+
+    def test_subcommand_usage(self):
+        self.assertIn("usage: cli.py help [-h] function", self.run_main("help"))
+
+
+if __name__ == "__main__":
+    unittest.main()
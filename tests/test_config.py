@@ -0,0 +1,62 @@
+import os
+import unittest
+
+from wikipedia_tool import config as config_module
+from wikipedia_tool.config import Config
+
+
+class ConfigEnvironmentTest(unittest.TestCase):
+    def setUp(self):
+        self._saved = {key: os.environ.get(key) for key in ("WIKIPEDIA_PROXIES", "WIKIPEDIA_TIMEOUT")}
+
+    def tearDown(self):
+        for key, value in self._saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        Config.reload_environment()
+
+    def test_reload_environment_affects_new_instances(self):
+        os.environ["WIKIPEDIA_TIMEOUT"] = "3"
+        os.environ["WIKIPEDIA_PROXIES"] = '{"http": "http://proxy:8080"}'
+        Config.reload_environment()
+        cfg = Config()
+        self.assertEqual(cfg.TIMEOUT, 3)
+        self.assertEqual(cfg.PROXIES, {"http": "http://proxy:8080"})
+
+    def test_existing_instances_need_refresh(self):
+        cfg = Config()
+        before = cfg.TIMEOUT
+        shared_before = config_module.config.TIMEOUT
+        os.environ["WIKIPEDIA_TIMEOUT"] = "7"
+        Config.reload_environment()
+        self.assertEqual(cfg.TIMEOUT, before)
+        self.assertEqual(config_module.config.TIMEOUT, shared_before)
+        cfg.refresh()
+        self.assertEqual(cfg.TIMEOUT, 7)
+        self.assertEqual(config_module.config.TIMEOUT, shared_before)
+
+    def test_refresh_keeps_extra_params(self):
+        cfg = Config()
+        cfg.update({"custom": 1})
+        cfg.refresh()
+        self.assertEqual(cfg.EXTRA_PARAMS, {"custom": 1})
+
+    def test_instances_do_not_share_proxies(self):
+        os.environ["WIKIPEDIA_PROXIES"] = '{"http": "x"}'
+        Config.reload_environment()
+        first, second = Config(), Config()
+        first.PROXIES["https"] = "y"
+        self.assertEqual(second.PROXIES, {"http": "x"})
+
+    def test_non_object_proxies_are_ignored(self):
+        for raw in ("null", "5", '"abc"', "[1, 2]", "not json"):
+            with self.subTest(raw=raw):
+                os.environ["WIKIPEDIA_PROXIES"] = raw
+                Config.reload_environment()
+                self.assertEqual(Config().PROXIES, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
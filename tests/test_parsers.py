@@ -0,0 +1,108 @@
+import unittest
+
+from wikipedia_tool.parsers import Section, clean_wikitext, parse_infobox, parse_sections, parse_sections_soa
+
+
+class CleanWikitextTest(unittest.TestCase):
+    def test_removes_templates_files_and_links(self):
+        text = "{{cite|x}}An [[England|English]] [[mathematician]].[[File:Ada.jpg|thumb|Portrait]]"
+        self.assertEqual(clean_wikitext(text), "An English mathematician.")
+
+    def test_link_text_is_cleaned(self):
+        self.assertEqual(clean_wikitext("[[a|b{{x}}]] [[c|'''d''']]"), "b d")
+
+    def test_template_inside_link(self):
+        self.assertEqual(clean_wikitext("See [[Paris|{{lang|fr|Paris}} city]]."), "See  city.")
+        self.assertNotIn("lang", clean_wikitext("[[{{lang|fr|Paris}}]]"))
+
+    def test_bold_italic(self):
+        self.assertEqual(clean_wikitext("'''''both'''''"), "both")
+
+    def test_bold_inside_italic(self):
+        self.assertEqual(clean_wikitext("''x'''y'''z''"), "xyz")
+
+
+ARTICLE = "intro\n== A ==\ntext a\n=== A1 ===\ndeep\n== B ==\nend\n"
+
+
+class SectionTest(unittest.TestCase):
+    def test_content_is_materialized_lazily(self):
+        section = Section._from_span("T", "xx  body  yy", 2, 10)
+        self.assertIsNone(section._content)
+        self.assertEqual(section.content, "body")
+        self.assertEqual(section._content, "body")
+
+    def test_content_setter(self):
+        section = Section._from_span("T", "source", 0, 6)
+        section.content = "replaced"
+        self.assertEqual(section.content, "replaced")
+        self.assertEqual(Section("T", "given").content, "given")
+
+    def test_has_no_instance_dict(self):
+        with self.assertRaises(AttributeError):
+            Section("T", "").other = 1
+
+
+class ParseSectionsTest(unittest.TestCase):
+    def test_hierarchy(self):
+        sections = parse_sections(ARTICLE)
+        self.assertEqual([s.title for s in sections], ["Introduction", "A", "B"])
+        self.assertEqual(sections[0].content, "intro")
+        self.assertEqual(sections[1].content, "text a\n=== A1 ===\ndeep")
+        self.assertEqual([s.title for s in sections[1].subsections], ["", "A1"])
+        self.assertEqual(sections[1].subsections[1].content, "deep")
+
+    def test_trailing_section_content_is_stripped(self):
+        sections = parse_sections(ARTICLE)
+        self.assertEqual(sections[-1].content, "end")
+
+    def test_without_headings(self):
+        sections = parse_sections("  just text  ")
+        self.assertEqual([(s.title, s.content) for s in sections], [("Introduction", "just text")])
+
+
+class ParseSectionsSoaTest(unittest.TestCase):
+    def test_matches_tree_in_document_order(self):
+        soa = parse_sections_soa(ARTICLE)
+        self.assertEqual(soa["titles"], ["Introduction", "A", "", "A1", "", "B"])
+        self.assertEqual(soa["parents"], [None, None, 1, 1, 3, None])
+        self.assertEqual(soa["contents"][3], "deep")
+        self.assertEqual(soa["contents"][-1], "end")
+
+    def test_lists_are_parallel(self):
+        soa = parse_sections_soa(ARTICLE)
+        self.assertEqual(len(soa["titles"]), len(soa["contents"]))
+        self.assertEqual(len(soa["titles"]), len(soa["parents"]))
+
+
+class ParseInfoboxTest(unittest.TestCase):
+    def test_fields_including_last(self):
+        text = "{{Infobox person\n| name = Ada\n| birth place = London\n}}\nBody"
+        self.assertEqual(parse_infobox(text), {"name": "Ada", "birth place": "London"})
+
+    def test_nested_template_value(self):
+        text = "{{Infobox person\n| born = {{birth date|1815|12|10}}\n| name = Ada\n}}"
+        self.assertEqual(parse_infobox(text), {"born": "{{birth date|1815|12|10}}", "name": "Ada"})
+
+    def test_link_pipe_does_not_split(self):
+        text = "{{Infobox person\n| spouse = [[William King|King]]\n| name = Ada\n}}"
+        self.assertEqual(parse_infobox(text), {"spouse": "[[William King|King]]", "name": "Ada"})
+
+    def test_single_line_and_case_insensitive(self):
+        self.assertEqual(parse_infobox("{{infobox|a=1|b=2}}"), {"a": "1", "b": "2"})
+
+    def test_missing_or_unterminated(self):
+        self.assertEqual(parse_infobox("no infobox here"), {})
+        self.assertEqual(parse_infobox("{{Infobox x\n| a = 1\n| b = 2"), {})
+
+    def test_unclosed_link_is_reset_at_newline(self):
+        text = "{{Infobox x\n| a = [[unclosed\n| b = 2\n}}"
+        self.assertEqual(parse_infobox(text), {"a": "[[unclosed", "b": "2"})
+
+    def test_stray_closing_brackets(self):
+        text = "{{Infobox x\n| a = 1]]\n| b = 2\n}}"
+        self.assertEqual(parse_infobox(text), {"a": "1]]", "b": "2"})
+
+
+if __name__ == "__main__":
+    unittest.main()
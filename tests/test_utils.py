@@ -0,0 +1,144 @@
+import math
+import unittest
+from unittest import mock
+
+from wikipedia_tool import utils
+from wikipedia_tool.utils import (
+    dict_to_query_params,
+    normalize_title,
+    normalize_titles,
+    parse_query_string,
+    retry,
+    safe_json_loads,
+    slugify,
+    slugify_many,
+)
+
+
+def _failing(failures, exc=ValueError):
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise exc("boom")
+        return len(calls)
+
+    return func, calls
+
+
+def _expected_delays(delay, backoff, count):
+    delays = []
+    for _ in range(count):
+        delays.append(delay)
+        delay *= backoff
+    return delays
+
+
+class RetryTest(unittest.TestCase):
+    def test_delay_schedule(self):
+        func, calls = _failing(10)
+        wrapped = retry(max_attempts=4, delay=0.5, backoff=3)(func)
+        with mock.patch("time.sleep") as sleep:
+            with self.assertRaises(ValueError):
+                wrapped()
+        self.assertEqual(len(calls), 4)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [0.5, 1.5, 4.5])
+
+    def test_delays_past_precomputed_schedule(self):
+        func, calls = _failing(30)
+        wrapped = retry(max_attempts=40, delay=0.1, backoff=1.5)(func)
+        with mock.patch("time.sleep") as sleep:
+            self.assertEqual(wrapped(), 31)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], _expected_delays(0.1, 1.5, 30))
+
+    def test_success_stops_retrying(self):
+        func, calls = _failing(1)
+        with mock.patch("time.sleep") as sleep:
+            self.assertEqual(retry(max_attempts=3, delay=1)(func)(), 2)
+        sleep.assert_called_once_with(1)
+
+    def test_unlisted_exceptions_are_not_retried(self):
+        func, calls = _failing(1, exc=KeyError)
+        with mock.patch("time.sleep") as sleep:
+            with self.assertRaises(KeyError):
+                retry(exceptions=(ValueError,))(func)()
+        sleep.assert_not_called()
+
+    def test_large_and_unbounded_attempt_counts(self):
+        retry(max_attempts=2000)(lambda: None)
+        func, calls = _failing(20)
+        with mock.patch("time.sleep") as sleep:
+            self.assertEqual(retry(max_attempts=float("inf"), delay=1, backoff=2)(func)(), 21)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], _expected_delays(1, 2, 20))
+
+    def test_delays_overflow_to_infinity(self):
+        func, calls = _failing(3)
+        with mock.patch("time.sleep") as sleep:
+            retry(max_attempts=10, delay=1e300, backoff=1e300)(func)()
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [1e300, float("inf"), float("inf")])
+
+
+class SlugifyTest(unittest.TestCase):
+    def test_basic(self):
+        self.assertEqual(slugify("  Hello, World -- Python's 3rd  "), "hello-world-pythons-3rd")
+
+    def test_non_ascii(self):
+        self.assertEqual(slugify("Café Münster x"), "caf-mnster-x")
+
+    def test_translate_table_does_not_grow(self):
+        size = len(utils._SLUG_TABLE)
+        slugify("".join(map(chr, range(128, 5000))))
+        self.assertEqual(len(utils._SLUG_TABLE), size)
+
+
+BATCH = [
+    "python_(programming language)",
+    "  Hello, World -- Python's 3rd  ",
+    "ßtraße_münchen",
+    "éclair\u3000",
+    "\u0149_x",
+    "_",
+    "",
+]
+
+
+class BatchHelpersTest(unittest.TestCase):
+    def test_match_scalar_functions(self):
+        self.assertEqual(slugify_many(BATCH), [slugify(text) for text in BATCH])
+        self.assertEqual(normalize_titles(BATCH), [normalize_title(title) for title in BATCH])
+
+    @unittest.skipUnless(utils._arrow(), "pyarrow is not installed")
+    def test_arrow_slugify_matches_scalar_on_non_ascii(self):
+        titles = [chr(codepoint) + "x_y " for codepoint in range(0x80, 0x3000)]
+        self.assertEqual(slugify_many(titles), [slugify(title) for title in titles])
+
+
+class SafeJsonLoadsTest(unittest.TestCase):
+    def test_values(self):
+        self.assertEqual(safe_json_loads('{"a": [1, 2]}'), {"a": [1, 2]})
+        self.assertIsNone(safe_json_loads("not json"))
+
+    def test_non_finite_numbers(self):
+        self.assertTrue(math.isnan(safe_json_loads("NaN")))
+        self.assertEqual(safe_json_loads("-Infinity"), float("-inf"))
+        self.assertEqual(safe_json_loads("1e400"), float("inf"))
+
+    def test_large_integers_are_exact(self):
+        self.assertEqual(safe_json_loads("123456789012345678901234567890"), 123456789012345678901234567890)
+
+
+class QueryStringTest(unittest.TestCase):
+    def test_plain_query(self):
+        self.assertEqual(
+            parse_query_string("action=query&format=json&&exintro&x=1=2"),
+            {"action": "query", "format": "json", "exintro": "", "x": "1=2"},
+        )
+
+    def test_encoded_round_trip(self):
+        params = {"titles": "Ada Lovelace", "q": "a&b=c"}
+        self.assertEqual(parse_query_string(dict_to_query_params(params)), params)
+
+
+if __name__ == "__main__":
+    unittest.main()
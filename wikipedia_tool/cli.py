@@ -1,10 +1,28 @@
 #!/usr/bin/env python
 import argparse
+import functools
 import inspect
 import json
 import sys
 
-import wikipedia_tool
+
+@functools.lru_cache(maxsize=1)
+def _public_funcs():
+    """
+    Return the public (name, function) pairs of the wikipedia_tool module.
+    The result is computed once per process.
+    """
+    import wikipedia_tool
+
+    return tuple(f for f in inspect.getmembers(wikipedia_tool, inspect.isfunction) if not f[0].startswith("_"))
+
+
+@functools.lru_cache(maxsize=1)
+def _docmap():
+    """
+    Return a mapping of public function names to the first line of their docstring.
+    """
+    return {name: (func.__doc__ or "").strip().partition("\n")[0] for name, func in _public_funcs()}
 
 
 def list_functions(args):
@@ -12,13 +30,11 @@ def list_functions(args):
     List all available functions in the wikipedia_tool module.
     If the verbose option is enabled, a brief description of each function is displayed.
     """
-    funcs = [f for f in inspect.getmembers(wikipedia_tool, inspect.isfunction) if not f[0].startswith("_")]
     if args.verbose:
-        for name, func in funcs:
-            doc_line = func.__doc__.strip().splitlines()[0] if func.__doc__ else ""
+        for name, doc_line in _docmap().items():
             print(f"{name}: {doc_line}")
     else:
-        for name, _ in funcs:
+        for name, _ in _public_funcs():
             print(name)
 
 
@@ -32,6 +48,8 @@ def help_function(args):
     Output:
         Prints the function's documentation if available.
     """
+    import wikipedia_tool
+
     func = getattr(wikipedia_tool, args.function, None)
     if not func:
         print(f"Function '{args.function}' not found.")
@@ -51,12 +69,13 @@ def run_function(args):
     Output:
         Prints the result of the function if any.
     """
+    import wikipedia_tool
+
     func = getattr(wikipedia_tool, args.function, None)
     if not func:
         print(f"Function '{args.function}' not found.")
         sys.exit(1)
 
-    sig = inspect.signature(func)
     kwargs = {}
 
     for kv in args.params:
@@ -88,27 +107,43 @@ def main():
       - help: Show documentation for a specific function.
       - run: Execute a function with key=value arguments.
     """
+    # The usage line is spelled out because only the requested subparser may be
+    # built below, and argparse would otherwise list just that one in errors.
     parser = argparse.ArgumentParser(
+        usage="%(prog)s [-h] {list,help,run} ...",
         description="Advanced CLI for wikipedia_tool with support for 300+ API options",
         epilog="Use 'list', 'help', or 'run' subcommands. Example:\n"
                "  - list [-v]\n"
                "  - help <function_name>\n"
                "  - run <function_name> key1=value1 key2=value2 ..."
     )
-    subparsers = parser.add_subparsers(title="subcommands", dest="subcommand", required=True)
-
-    list_parser = subparsers.add_parser("list", help="List all available functions")
-    list_parser.add_argument("-v", "--verbose", action="store_true", help="Show brief descriptions of functions")
-    list_parser.set_defaults(func=list_functions)
-
-    help_parser = subparsers.add_parser("help", help="Show documentation for a specific function")
-    help_parser.add_argument("function", help="Function name")
-    help_parser.set_defaults(func=help_function)
-
-    run_parser = subparsers.add_parser("run", help="Execute a function with key=value parameters")
-    run_parser.add_argument("function", help="Function name")
-    run_parser.add_argument("params", nargs="*", help="Parameters in key=value format")
-    run_parser.set_defaults(func=run_function)
+    subparsers = parser.add_subparsers(title="subcommands", dest="subcommand", required=True, prog=parser.prog)
+
+    def p_list():
+        list_parser = subparsers.add_parser("list", help="List all available functions")
+        list_parser.add_argument("-v", "--verbose", action="store_true", help="Show brief descriptions of functions")
+        list_parser.set_defaults(func=list_functions)
+
+    def p_help():
+        help_parser = subparsers.add_parser("help", help="Show documentation for a specific function")
+        help_parser.add_argument("function", help="Function name")
+        help_parser.set_defaults(func=help_function)
+
+    def p_run():
+        run_parser = subparsers.add_parser("run", help="Execute a function with key=value parameters")
+        run_parser.add_argument("function", help="Function name")
+        run_parser.add_argument("params", nargs="*", help="Parameters in key=value format")
+        run_parser.set_defaults(func=run_function)
+
+    # Only build the subparser that is actually requested; -h and unknown
+    # subcommands fall back to the full set so usage output stays complete.
+    builders = {"list": p_list, "help": p_help, "run": p_run}
+    requested = sys.argv[1:2]
+    if requested and requested[0] in builders:
+        builders[requested[0]]()
+    else:
+        for build in builders.values():
+            build()
 
     args = parser.parse_args()
     args.func(args)
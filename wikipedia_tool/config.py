@@ -8,7 +8,50 @@ values, environment variable overrides, and dynamic updates.
 
 import os
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+
+_ENV_KEYS = (
+    "WIKIPEDIA_API_URL",
+    "WIKIPEDIA_LANGUAGE",
+    "WIKIPEDIA_USER_AGENT",
+    "WIKIPEDIA_TIMEOUT",
+    "WIKIPEDIA_PROXIES",
+)
+
+
+def _read_env() -> Dict[str, str]:
+    """
+    Take a snapshot of the environment variables used by Config.
+
+    Returns:
+        Dict[str, str]: The value of each known variable that is set.
+    """
+    return {key: os.environ[key] for key in _ENV_KEYS if key in os.environ}
+
+
+def _parse_proxies(proxies_env: Optional[str]) -> Dict[str, str]:
+    """
+    Parse the JSON proxy configuration, returning an empty dict if it is unset, invalid,
+    or not a JSON object.
+
+    Args:
+        proxies_env (Optional[str]): The raw WIKIPEDIA_PROXIES value.
+
+    Returns:
+        Dict[str, str]: The parsed proxy configuration.
+    """
+    if not proxies_env:
+        return {}
+    try:
+        proxies = json.loads(proxies_env)
+    except Exception:
+        return {}
+    return proxies if isinstance(proxies, dict) else {}
+
+
+_ENV_CACHE: Dict[str, str] = _read_env()
+_PROXIES: Dict[str, str] = _parse_proxies(_ENV_CACHE.get("WIKIPEDIA_PROXIES"))
 
 
 class Config:
@@ -25,19 +68,41 @@ class Config:
     """
 
     def __init__(self) -> None:
-        self.API_URL: str = os.environ.get("WIKIPEDIA_API_URL", "https://en.wikipedia.org/w/api.php")
-        self.LANGUAGE: str = os.environ.get("WIKIPEDIA_LANGUAGE", "en")
-        self.USER_AGENT: str = os.environ.get("WIKIPEDIA_USER_AGENT", "wikipedia_tool/1.0 (https://github.com/yourusername/wikipedia-tool)")
-        self.TIMEOUT: int = int(os.environ.get("WIKIPEDIA_TIMEOUT", "10"))
-        self.PROXIES: Dict[str, str] = {}
-        proxies_env: str = os.environ.get("WIKIPEDIA_PROXIES", "")
-        if proxies_env:
-            try:
-                self.PROXIES = json.loads(proxies_env)
-            except Exception:
-                self.PROXIES = {}
+        self._load()
         self.EXTRA_PARAMS: Dict[str, Any] = {}
 
+    def _load(self) -> None:
+        env = _ENV_CACHE
+        self.API_URL: str = env.get("WIKIPEDIA_API_URL", "https://en.wikipedia.org/w/api.php")
+        self.LANGUAGE: str = env.get("WIKIPEDIA_LANGUAGE", "en")
+        self.USER_AGENT: str = env.get("WIKIPEDIA_USER_AGENT", "wikipedia_tool/1.0 (https://github.com/yourusername/wikipedia-tool)")
+        self.TIMEOUT: int = int(env.get("WIKIPEDIA_TIMEOUT", "10"))
+        self.PROXIES: Dict[str, str] = dict(_PROXIES)
+
+    @classmethod
+    def reload_environment(cls) -> None:
+        """
+        Re-read the WIKIPEDIA_* environment variables into the shared snapshot.
+
+        The environment is normally read once at import time; call this after changing
+        os.environ (e.g. in tests). New Config instances use the reloaded values, while
+        existing instances, including the module-level config, keep theirs until their
+        refresh() method is called.
+        """
+        global _PROXIES
+        _ENV_CACHE.clear()
+        _ENV_CACHE.update(_read_env())
+        _PROXIES = _parse_proxies(_ENV_CACHE.get("WIKIPEDIA_PROXIES"))
+
+    def refresh(self) -> None:
+        """
+        Reload the environment-derived settings of this instance from the current snapshot.
+
+        Call Config.reload_environment() first to pick up changes to os.environ.
+        EXTRA_PARAMS is left untouched.
+        """
+        self._load()
+
     def update(self, config_updates: Dict[str, Any]) -> None:
         """
         Update configuration parameters with the provided dictionary.
@@ -68,4 +133,6 @@ class Config:
         }
 
 
+# Shared instance built from the environment at import time. After changing
+# os.environ, call Config.reload_environment() and then config.refresh().
 config = Config()
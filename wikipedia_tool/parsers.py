@@ -1,21 +1,63 @@
 #!/usr/bin/env python
 import re
-from typing import List, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+_HEADING_RE = re.compile(r'^(={2,6})\s*(.*?)\s*\1\s*$', re.MULTILINE)
+_INFOBOX_START_RE = re.compile(r'\{\{Infobox', re.IGNORECASE)
+_INFOBOX_TOKEN_RE = re.compile(r'\{\{|\}\}|\[\[|\]\]|\||\n')
+_LINK_RE = re.compile(r'\[\[([^\]|]+)(?:\|[^\]]+)?\]\]')
+_TEMPLATE_RE = re.compile(r'\{\{(.*?)\}\}', re.DOTALL)
+_REF_RE = re.compile(r'<ref[^>]*>(.*?)</ref>', re.DOTALL | re.IGNORECASE)
+_FILE_RE = re.compile(r'\[\[File:[^\]]+\]\]', re.IGNORECASE)
+_LINK_REPLACE_RE = re.compile(r'\[\[(?:[^\]|]+\|)?([^\]]+)\]\]')
+_BOLD_RE = re.compile(r"'''(.*?)'''")
+_ITALIC_RE = re.compile(r"''(.*?)''")
 
 class Section:
     """
     Represents a section of a Wikipedia article.
 
+    Sections produced by parse_sections only record where their content lies in
+    the source wikitext; the content string is sliced and stripped on first access.
+
     Attributes:
         title (str): The title of the section.
         content (str): The raw content of the section.
         subsections (List[Section]): A list of subsections within the section.
     """
+    __slots__ = ("title", "_content", "subsections", "_source", "_start", "_end")
+
     def __init__(self, title: str, content: str, subsections: Optional[List["Section"]] = None) -> None:
         self.title = title
-        self.content = content
+        self._content: Optional[str] = content
+        self._source = ""
+        self._start = 0
+        self._end = 0
         self.subsections = subsections if subsections is not None else []
 
+    @classmethod
+    def _from_span(cls, title: str, source: str, start: int, end: int) -> "Section":
+        section = cls(title=title, content="")
+        section._set_span(source, start, end)
+        return section
+
+    def _set_span(self, source: str, start: int, end: int) -> None:
+        self._source = source
+        self._start = start
+        self._end = end
+        self._content = None
+
+    @property
+    def content(self) -> str:
+        if self._content is None:
+            self._content = self._source[self._start:self._end].strip()
+            self._source = ""
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+
     def __repr__(self) -> str:
         return f"Section(title={self.title!r}, content_length={len(self.content)}, subsections={len(self.subsections)})"
 
@@ -33,48 +75,72 @@ def parse_sections(wikitext: str) -> List[Section]:
     Returns:
         List[Section]: A list of top-level Section objects representing the article's sections.
     """
-    heading_pattern = re.compile(r'^(={2,6})\s*(.*?)\s*\1\s*$', re.MULTILINE)
-    headings = list(heading_pattern.finditer(wikitext))
+    headings = list(_HEADING_RE.finditer(wikitext))
     sections = []
     if not headings:
-        sections.append(Section(title="Introduction", content=wikitext.strip()))
+        sections.append(Section._from_span("Introduction", wikitext, 0, len(wikitext)))
         return sections
 
     stack = []
     last_index = 0
     for match in headings:
-        level = len(match.group(1))
-        title = match.group(2)
-        start_index = match.start()
+        marker, title = match.groups()
+        level = len(marker)
+        start_index, end_index = match.span()
         if last_index < start_index:
-            content = wikitext[last_index:start_index].strip()
             if stack:
-                stack[-1][1].subsections.append(Section(title="", content=content))
+                stack[-1][1].subsections.append(Section._from_span("", wikitext, last_index, start_index))
             else:
-                sections.append(Section(title="Introduction", content=content))
+                sections.append(Section._from_span("Introduction", wikitext, last_index, start_index))
         current_section = Section(title=title, content="")
-        current_section.start_index = match.end()
         while stack and stack[-1][0] >= level:
-            _, sec = stack.pop()
-            sec.content = wikitext[sec.start_index:match.start()].strip()
+            _, sec, content_start = stack.pop()
+            sec._set_span(wikitext, content_start, start_index)
         if stack:
             stack[-1][1].subsections.append(current_section)
         else:
             sections.append(current_section)
-        stack.append((level, current_section))
-        last_index = match.end()
-    if last_index < len(wikitext):
-        remaining = wikitext[last_index:].strip()
+        stack.append((level, current_section, end_index))
+        last_index = end_index
+    text_end = len(wikitext)
+    if last_index < text_end:
         if stack:
-            stack[-1][1].content += "\n" + remaining
+            stack[-1][1]._set_span(wikitext, last_index, text_end)
         else:
-            sections.append(Section(title="Introduction", content=remaining))
-    for _, sec in stack:
-        if hasattr(sec, "start_index"):
-            del sec.start_index
+            sections.append(Section._from_span("Introduction", wikitext, last_index, text_end))
     return sections
 
 
+def parse_sections_soa(wikitext: str) -> Dict[str, List[Any]]:
+    """
+    Parse the wikitext of a Wikipedia page into parallel arrays of section data.
+
+    This is a flat alternative to parse_sections for bulk processing: sections are
+    listed in document (pre-order) order, and entry i of each list describes the
+    same section.
+
+    Args:
+        wikitext (str): The raw wikitext of a Wikipedia article.
+
+    Returns:
+        Dict[str, List[Any]]: A dictionary with "titles" and "contents" lists of strings
+        and a "parents" list holding the index of each section's parent, or None for
+        top-level sections.
+    """
+    titles: List[str] = []
+    contents: List[str] = []
+    parents: List[Optional[int]] = []
+    pending = [(section, None) for section in reversed(parse_sections(wikitext))]
+    while pending:
+        section, parent = pending.pop()
+        index = len(titles)
+        titles.append(section.title)
+        contents.append(section.content)
+        parents.append(parent)
+        pending.extend((sub, index) for sub in reversed(section.subsections))
+    return {"titles": titles, "contents": contents, "parents": parents}
+
+
 def parse_infobox(wikitext: str) -> Dict[str, str]:
     """
     Extract and parse the infobox from the wikitext of a Wikipedia page.
@@ -88,17 +154,50 @@ def parse_infobox(wikitext: str) -> Dict[str, str]:
     Returns:
         Dict[str, str]: A dictionary of infobox parameters and their values.
     """
-    infobox_pattern = re.compile(r'\{\{Infobox(.*?)\n\}\}', re.DOTALL | re.IGNORECASE)
-    match = infobox_pattern.search(wikitext)
-    if not match:
+    # Pages without an infobox are rejected by this single search. The pattern
+    # starts with a literal "{{", so it is as fast as str.find, and unlike
+    # wikitext.lower().find() it needs no copy and its offsets stay valid for
+    # non-ASCII text whose lowercase form has a different length.
+    start = _INFOBOX_START_RE.search(wikitext)
+    if not start:
+        return {}
+    # Walk the brace/bracket/pipe tokens from the start of the infobox, tracking
+    # nesting so that pipes inside nested templates or links do not split fields
+    # and the infobox ends at its own matching closing braces. Wiki links cannot
+    # span lines, so an unclosed "[[" is forgotten at the next newline.
+    template_depth = 0
+    link_depth = 0
+    field_start = None
+    fields = []
+    for token in _INFOBOX_TOKEN_RE.finditer(wikitext, start.start()):
+        symbol = token.group()
+        if symbol == "{{":
+            template_depth += 1
+        elif symbol == "}}":
+            template_depth -= 1
+            if not template_depth:
+                if field_start is not None:
+                    fields.append(wikitext[field_start:token.start()])
+                break
+        elif symbol == "[[":
+            link_depth += 1
+        elif symbol == "]]":
+            if link_depth:
+                link_depth -= 1
+        elif symbol == "\n":
+            link_depth = 0
+        elif template_depth == 1 and not link_depth:
+            if field_start is not None:
+                fields.append(wikitext[field_start:token.start()])
+            field_start = token.end()
+    else:
         return {}
-    infobox_content = match.group(1)
-    param_pattern = re.compile(r'\|\s*(\w+)\s*=\s*(.*?)\n(?=\||$)', re.DOTALL)
     params = {}
-    for param_match in param_pattern.finditer(infobox_content):
-        key = param_match.group(1).strip()
-        value = param_match.group(2).strip()
-        params[key] = value
+    for field in fields:
+        key, sep, value = field.partition("=")
+        key = key.strip()
+        if sep and key:
+            params[key] = value.strip()
     return params
 
 
@@ -115,8 +214,7 @@ def parse_links(wikitext: str) -> List[str]:
     Returns:
         List[str]: A list of internal link targets.
     """
-    link_pattern = re.compile(r'\[\[([^\]|]+)(?:\|[^\]]+)?\]\]')
-    return [match.group(1).strip() for match in link_pattern.finditer(wikitext)]
+    return list(map(str.strip, _LINK_RE.findall(wikitext)))
 
 
 def clean_wikitext(wikitext: str) -> str:
@@ -132,19 +230,37 @@ def clean_wikitext(wikitext: str) -> str:
     Returns:
         str: The cleaned plain text.
     """
-    text = re.sub(r'\{\{.*?\}\}', '', wikitext, flags=re.DOTALL)
-    text = re.sub(r'\[\[File:[^\]]+\]\]', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\[\[(?:[^\]|]+\|)?([^\]]+)\]\]', r'\1', text)
-    text = re.sub(r"'''(.*?)'''", r'\1', text)
-    text = re.sub(r"''(.*?)''", r'\1', text)
+    text = _TEMPLATE_RE.sub('', wikitext)
+    text = _FILE_RE.sub('', text)
+    text = _LINK_REPLACE_RE.sub(r'\1', text)
+    text = _BOLD_RE.sub(r'\1', text)
+    text = _ITALIC_RE.sub(r'\1', text)
     return text.strip()
 
 
+def iter_references(wikitext: str) -> Iterator[str]:
+    """
+    Lazily yield references from the wikitext of a Wikipedia page.
+
+    Works like parse_references, but each <ref>...</ref> tag is only located when
+    requested, so callers looking for a specific reference can stop early.
+
+    Args:
+        wikitext (str): The raw wikitext of a Wikipedia article.
+
+    Yields:
+        str: The contents of each reference, in order of appearance.
+    """
+    for match in _REF_RE.finditer(wikitext):
+        yield match.group(1).strip()
+
+
 def parse_references(wikitext: str) -> List[str]:
     """
     Extract references from the wikitext of a Wikipedia page.
 
     The function searches for <ref>...</ref> tags and returns a list of reference contents.
+    Use iter_references when the references are only iterated once.
 
     Args:
         wikitext (str): The raw wikitext of a Wikipedia article.
@@ -152,8 +268,24 @@ def parse_references(wikitext: str) -> List[str]:
     Returns:
         List[str]: A list of references extracted from the text.
     """
-    ref_pattern = re.compile(r'<ref[^>]*>(.*?)</ref>', re.DOTALL | re.IGNORECASE)
-    return [ref.strip() for ref in ref_pattern.findall(wikitext)]
+    return list(iter_references(wikitext))
+
+
+def iter_templates(wikitext: str) -> Iterator[str]:
+    """
+    Lazily yield templates from the wikitext.
+
+    Works like parse_templates, but each {{...}} template is only located when
+    requested, so callers filtering for a specific template can stop early.
+
+    Args:
+        wikitext (str): The raw wikitext of a Wikipedia article.
+
+    Yields:
+        str: The contents of each template, in order of appearance.
+    """
+    for match in _TEMPLATE_RE.finditer(wikitext):
+        yield match.group(1).strip()
 
 
 def parse_templates(wikitext: str) -> List[str]:
@@ -161,6 +293,7 @@ def parse_templates(wikitext: str) -> List[str]:
     Extract all templates from the wikitext.
 
     Templates are identified by {{...}} syntax. This function returns a list of template contents.
+    Use iter_templates when the templates are only iterated once.
 
     Args:
         wikitext (str): The raw wikitext of a Wikipedia article.
@@ -168,5 +301,4 @@ def parse_templates(wikitext: str) -> List[str]:
     Returns:
         List[str]: A list of template contents.
     """
-    template_pattern = re.compile(r'\{\{(.*?)\}\}', re.DOTALL)
-    return [tpl.strip() for tpl in template_pattern.findall(wikitext)]
+    return list(iter_templates(wikitext))
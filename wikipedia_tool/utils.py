@@ -8,12 +8,16 @@ These utilities are designed to support robust operations throughout the wikiped
 
 import functools
 import time
-import re
 import json
-from typing import Any, Callable, Dict, TypeVar
+from collections import ChainMap
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+from urllib.parse import parse_qsl, urlencode
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Number of retry delays precomputed per decorated function.
+_RETRY_SCHEDULE_SIZE = 16
+
 
 def retry(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0, exceptions: tuple = (Exception,)) -> Callable[[F], F]:
     """
@@ -29,10 +33,20 @@ def retry(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0, excep
         Callable: The decorated function with retry logic.
     """
     def decorator(func: F) -> F:
+        # The first delays only depend on the decorator arguments, so compute them
+        # once, using the same running multiplication as the per-call fallback.
+        # Retries past the precomputed part keep multiplying at call time.
+        schedule = []
+        next_delay = delay
+        while len(schedule) < _RETRY_SCHEDULE_SIZE and len(schedule) < max_attempts - 1:
+            schedule.append(next_delay)
+            next_delay *= backoff
+        precomputed = tuple(schedule)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             attempts = 0
-            current_delay = delay
+            current_delay = next_delay
             while attempts < max_attempts:
                 try:
                     return func(*args, **kwargs)
@@ -40,12 +54,42 @@ def retry(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0, excep
                     attempts += 1
                     if attempts >= max_attempts:
                         raise e
-                    time.sleep(current_delay)
-                    current_delay *= backoff
+                    if attempts <= len(precomputed):
+                        time.sleep(precomputed[attempts - 1])
+                    else:
+                        time.sleep(current_delay)
+                        current_delay *= backoff
         return wrapper  # type: ignore
     return decorator
 
 
+class _SlugTable(dict):
+    """
+    str.translate table for slugify: keeps ASCII letters and digits, maps whitespace
+    and hyphens to a space and drops everything else.
+
+    ASCII entries are prefilled; other codepoints are resolved on lookup without being
+    stored, so the table stays a fixed size however much text it translates.
+    """
+    def __init__(self) -> None:
+        super().__init__((codepoint, self._resolve(codepoint)) for codepoint in range(128))
+
+    @staticmethod
+    def _resolve(codepoint: int) -> Any:
+        char = chr(codepoint)
+        if char.isascii() and char.isalnum():
+            return codepoint
+        if char.isspace() or char == "-":
+            return " "
+        return None
+
+    def __missing__(self, codepoint: int) -> Any:
+        return self._resolve(codepoint)
+
+
+_SLUG_TABLE = _SlugTable()
+
+
 def slugify(text: str) -> str:
     """
     Convert the given text to a slug suitable for URLs.
@@ -56,12 +100,7 @@ def slugify(text: str) -> str:
     Returns:
         str: A slugified version of the text.
     """
-    text = text.lower()
-    text = re.sub(r'[^a-z0-9\s-]', '', text)
-    text = re.sub(r'[\s-]+', ' ', text)
-    text = text.strip()
-    slug = re.sub(r'\s', '-', text)
-    return slug
+    return "-".join(text.lower().translate(_SLUG_TABLE).split())
 
 
 def normalize_title(title: str) -> str:
@@ -75,11 +114,70 @@ def normalize_title(title: str) -> str:
         str: The normalized title.
     """
     title = title.replace("_", " ").strip()
-    if title:
-        title = title[0].upper() + title[1:]
+    first = title[:1]
+    upper = first.upper()
+    if upper != first:
+        title = upper + title[1:]
     return title
 
 
+@functools.lru_cache(maxsize=1)
+def _arrow() -> Optional[Tuple[Any, Any]]:
+    """
+    Import pyarrow on first use, so that importing this module does not pay for it.
+
+    Returns:
+        Optional[Tuple[Any, Any]]: The pyarrow and pyarrow.compute modules, or None if
+        pyarrow is not installed.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return None
+    return pa, pc
+
+
+# Characters treated as whitespace by str.isspace, for the Arrow (RE2) regexes.
+_ARROW_SPACE = r"\s\v\x1c-\x1f\x85\p{Z}"
+
+
+def slugify_many(texts: Iterable[str]) -> List[str]:
+    """
+    Slugify a batch of strings, equivalent to calling slugify on each of them.
+
+    When pyarrow is installed the batch is processed with Arrow's vectorized string
+    kernels; otherwise this falls back to slugify.
+
+    Args:
+        texts (Iterable[str]): The input texts.
+
+    Returns:
+        List[str]: The slugified texts, in input order.
+    """
+    arrow = _arrow()
+    if arrow is None:
+        return [slugify(text) for text in texts]
+    pa, pc = arrow
+    arr = pc.utf8_lower(pa.array(list(texts), type=pa.string()))
+    arr = pc.replace_substring_regex(arr, rf"[^a-z0-9{_ARROW_SPACE}-]", "")
+    arr = pc.replace_substring_regex(arr, rf"[{_ARROW_SPACE}-]+", "-")
+    return pc.utf8_trim(arr, "-").to_pylist()
+
+
+def normalize_titles(titles: Iterable[str]) -> List[str]:
+    """
+    Normalize a batch of page titles, equivalent to calling normalize_title on each of them.
+
+    Args:
+        titles (Iterable[str]): The original page titles.
+
+    Returns:
+        List[str]: The normalized titles, in input order.
+    """
+    return [normalize_title(title) for title in titles]
+
+
 def merge_dicts(*dicts: Dict[Any, Any]) -> Dict[Any, Any]:
     """
     Merge multiple dictionaries into one. In case of key conflicts, later dictionaries override earlier ones.
@@ -90,12 +188,29 @@ def merge_dicts(*dicts: Dict[Any, Any]) -> Dict[Any, Any]:
     Returns:
         Dict[Any, Any]: The merged dictionary.
     """
+    if len(dicts) == 2:
+        return {**dicts[0], **dicts[1]}
     result = {}
+    update = result.update
     for d in dicts:
-        result.update(d)
+        update(d)
     return result
 
 
+def chain_dicts(*dicts: Dict[Any, Any]) -> ChainMap:
+    """
+    Return a read-mostly view over multiple dictionaries without copying them.
+    Lookups follow the same precedence as merge_dicts: later dictionaries override earlier ones.
+
+    Args:
+        *dicts (Dict[Any, Any]): Arbitrary number of dictionaries.
+
+    Returns:
+        ChainMap: A view of the combined dictionaries. Writes go to the last dictionary.
+    """
+    return ChainMap(*reversed(dicts))
+
+
 def safe_json_loads(s: str) -> Any:
     """
     Safely parse a JSON string and return the corresponding Python object.
@@ -116,6 +231,7 @@ def safe_json_loads(s: str) -> Any:
 def dict_to_query_params(params: Dict[str, Any]) -> str:
     """
     Convert a dictionary of parameters into a URL query string.
+    Keys and values are percent-encoded; sequence values produce one pair per item.
 
     Args:
         params (Dict[str, Any]): Dictionary of query parameters.
@@ -123,15 +239,13 @@ def dict_to_query_params(params: Dict[str, Any]) -> str:
     Returns:
         str: A URL-encoded query string.
     """
-    parts = []
-    for key, value in params.items():
-        parts.append(f"{key}={value}")
-    return "&".join(parts)
+    return urlencode(params, doseq=True)
 
 
 def parse_query_string(query: str) -> Dict[str, str]:
     """
     Parse a URL query string into a dictionary of parameters.
+    Keys and values are percent-decoded.
 
     Args:
         query (str): The query string.
@@ -139,10 +253,13 @@ def parse_query_string(query: str) -> Dict[str, str]:
     Returns:
         Dict[str, str]: A dictionary of query parameters.
     """
-    pairs = query.split("&")
+    if "%" in query or "+" in query:
+        return dict(parse_qsl(query, keep_blank_values=True))
+    # Nothing to decode: split directly, with the same handling of empty
+    # pairs and missing values as parse_qsl.
     result = {}
-    for pair in pairs:
-        if "=" in pair:
-            key, value = pair.split("=", 1)
+    for pair in query.split("&"):
+        if pair:
+            key, _, value = pair.partition("=")
             result[key] = value
     return result